@@ -4,8 +4,15 @@ database.py - Histórico de vagas em SQLite
 
 from __future__ import annotations
 
+import hashlib
+import pickle
+import re
 import sqlite3
+import threading
+import time
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 
 import pandas as pd
@@ -34,15 +41,135 @@ CREATE TABLE IF NOT EXISTS vagas (
 """
 
 
-def _connect() -> sqlite3.Connection:
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
+# Índices para load_history (ORDER BY data_coleta / filtro por site) e
+# get_stats (GROUP BY site, contagem de emails)
+_CREATE_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_vagas_coleta ON vagas(data_coleta DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_vagas_site ON vagas(site, data_coleta)",
+    """
+    CREATE INDEX IF NOT EXISTS idx_vagas_email ON vagas(email_recrutador)
+    WHERE email_recrutador IS NOT NULL AND email_recrutador != ''
+    """,
+)
+
+# Busca textual (título/empresa/termo) via FTS5, mantida por triggers
+_CREATE_FTS = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS vagas_fts USING fts5(
+        titulo, empresa, termo_busca,
+        content='vagas', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS vagas_fts_ai AFTER INSERT ON vagas BEGIN
+        INSERT INTO vagas_fts (rowid, titulo, empresa, termo_busca)
+        VALUES (new.id, new.titulo, new.empresa, new.termo_busca);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS vagas_fts_ad AFTER DELETE ON vagas BEGIN
+        INSERT INTO vagas_fts (vagas_fts, rowid, titulo, empresa, termo_busca)
+        VALUES ('delete', old.id, old.titulo, old.empresa, old.termo_busca);
+    END
+    """,
+)
+
+# Cache de respostas das fontes (DuckDuckGo, JobSpy), com timestamp e o TTL
+# de quem gravou cada entrada (usado para apagar as vencidas)
+_CREATE_CACHE = """
+CREATE TABLE IF NOT EXISTS cache (
+    key     TEXT PRIMARY KEY,
+    ts      INTEGER,
+    ttl     INTEGER,
+    payload BLOB
+)
+"""
+
+# Colunas gravadas por save_jobs, na ordem do INSERT
+_INSERT_COLUMNS = (
+    "link", "site", "titulo", "empresa", "localizacao", "remoto",
+    "tipo_vaga", "salario_min", "salario_max", "moeda",
+    "data_postagem", "email_recrutador", "nome_recrutador",
+    "termo_busca", "data_coleta",
+)
+_TEXT_COLUMNS = (
+    "link", "site", "titulo", "empresa", "localizacao", "tipo_vaga",
+    "moeda", "data_postagem", "email_recrutador", "nome_recrutador",
+)
+_NULL_TEXT = ("", "nan", "None")
+
+# INSERT multi-linha: cada statement respeita o limite clássico de 999
+# parâmetros do SQLite (SQLITE_MAX_VARIABLE_NUMBER)
+_CHUNK_ROWS = 999 // len(_INSERT_COLUMNS)
+
+# Ajustes por conexão: WAL + synchronous=NORMAL evitam um fsync por transação
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA mmap_size=268435456",
+)
+
+_local = threading.local()
+_init_lock = threading.Lock()
+_initialized = False
+_has_fts = False
+
+
+def _get_conn() -> sqlite3.Connection:
+    """Conexão reaproveitada por thread (objetos sqlite3 não são thread-safe)."""
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(DB_PATH)
+        conn.row_factory = sqlite3.Row
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        _local.conn = conn
+        _init_schema(conn)
     return conn
 
 
+def _init_schema(conn: sqlite3.Connection) -> None:
+    global _initialized, _has_fts
+    with _init_lock:
+        if _initialized:
+            return
+        with conn:
+            # journal_mode é persistente no arquivo — basta aplicar uma vez
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_CREATE_TABLE)
+            for ddl in _CREATE_INDEXES:
+                conn.execute(ddl)
+            conn.execute(_CREATE_CACHE)
+            # Cache gravado sem a coluna ttl: é só cache, recria vazio
+            cols = {r[1] for r in conn.execute("PRAGMA table_info(cache)")}
+            if "ttl" not in cols:
+                conn.execute("DROP TABLE cache")
+                conn.execute(_CREATE_CACHE)
+        _has_fts = _init_fts(conn)
+        _initialized = True
+
+
+def _init_fts(conn: sqlite3.Connection) -> bool:
+    """Cria o índice FTS5; retorna False se o SQLite não tiver FTS5."""
+    existed = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'vagas_fts'"
+    ).fetchone()
+    try:
+        with conn:
+            for ddl in _CREATE_FTS:
+                conn.execute(ddl)
+            if not existed:
+                # Indexa o histórico gravado antes do FTS existir
+                conn.execute("INSERT INTO vagas_fts (vagas_fts) VALUES ('rebuild')")
+    except sqlite3.OperationalError:
+        return False
+    return True
+
+
 def init_db() -> None:
-    with _connect() as conn:
-        conn.execute(_CREATE_TABLE)
+    _get_conn()
 
 
 def save_jobs(df: pd.DataFrame, search_term: str = "") -> int:
@@ -52,47 +179,31 @@ def save_jobs(df: pd.DataFrame, search_term: str = "") -> int:
     Returns:
         Número de vagas novas inseridas.
     """
-    init_db()
     if df.empty:
         return 0
 
     coleta = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    inserted = 0
+    rows = _to_rows(df, search_term, coleta)
 
-    with _connect() as conn:
-        for _, row in df.iterrows():
-            try:
-                conn.execute(
-                    """
-                    INSERT OR IGNORE INTO vagas
-                        (link, site, titulo, empresa, localizacao, remoto,
-                         tipo_vaga, salario_min, salario_max, moeda,
-                         data_postagem, email_recrutador, nome_recrutador,
-                         termo_busca, data_coleta)
-                    VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-                    """,
-                    (
-                        _str(row.get("link")),
-                        _str(row.get("site")),
-                        _str(row.get("titulo")),
-                        _str(row.get("empresa")),
-                        _str(row.get("localizacao")),
-                        int(bool(row.get("remoto", False))),
-                        _str(row.get("tipo_vaga")),
-                        _float(row.get("salario_min")),
-                        _float(row.get("salario_max")),
-                        _str(row.get("moeda")),
-                        _str(row.get("data_postagem")),
-                        _str(row.get("email_recrutador")),
-                        _str(row.get("nome_recrutador")),
-                        search_term,
-                        coleta,
-                    ),
-                )
-                if conn.execute("SELECT changes()").fetchone()[0]:
-                    inserted += 1
-            except Exception:
-                pass
+    inserted = 0
+    try:
+        with _get_conn() as conn:
+            # rowcount (sqlite3_changes) já é a contagem do próprio INSERT e
+            # não inclui as linhas gravadas pelos triggers do FTS
+            changes = 0
+            for start in range(0, len(rows), _CHUNK_ROWS):
+                chunk = rows[start:start + _CHUNK_ROWS]
+                cur = conn.execute(_insert_sql(len(chunk)), list(chain.from_iterable(chunk)))
+                changes += cur.rowcount
+            if changes:
+                # Mantém sqlite_stat1 em dia para o planner escolher os índices;
+                # optimize só reanalisa o que mudou e com amostragem limitada
+                conn.execute("PRAGMA analysis_limit=400")
+                conn.execute("PRAGMA optimize")
+        # Só conta depois do commit: em caso de erro o lote inteiro é desfeito
+        inserted = changes
+    except sqlite3.Error:
+        pass
 
     return inserted
 
@@ -107,15 +218,21 @@ def load_history(
 
     Args:
         limit: Máximo de linhas a retornar.
-        search_filter: Filtra por título ou empresa (LIKE).
+        search_filter: Filtra por título, empresa ou termo de busca (prefixo
+            de palavra via FTS5; LIKE quando FTS5 não estiver disponível).
         site_filter: Filtra por site exato.
     """
-    init_db()
-
+    conn = _get_conn()
     conditions = []
     params: list = []
 
-    if search_filter:
+    # Prefixo de palavra em termo_busca (e em título/empresa) sai do índice
+    # FTS5, sem LIKE; o fallback sem FTS5 ainda varre a tabela com '%x%'
+    match = _fts_query(search_filter) if _has_fts else ""
+    if match:
+        conditions.append("id IN (SELECT rowid FROM vagas_fts WHERE vagas_fts MATCH ?)")
+        params.append(match)
+    elif search_filter:
         conditions.append("(titulo LIKE ? OR empresa LIKE ? OR termo_busca LIKE ?)")
         like = f"%{search_filter}%"
         params += [like, like, like]
@@ -137,14 +254,18 @@ def load_history(
         LIMIT ?
     """
 
-    with _connect() as conn:
-        return pd.read_sql_query(query, conn, params=params)
+    # Linhas como tuplas simples e DataFrame montado direto dos registros,
+    # sem a camada de conversão por célula do read_sql_query
+    cur = conn.cursor()
+    cur.row_factory = None
+    cur.execute(query, params)
+    columns = [c[0] for c in cur.description]
+    return pd.DataFrame.from_records(cur.fetchall(), columns=columns, coerce_float=True)
 
 
 def get_stats() -> dict:
     """Retorna estatísticas rápidas do histórico."""
-    init_db()
-    with _connect() as conn:
+    with _get_conn() as conn:
         total = conn.execute("SELECT COUNT(*) FROM vagas").fetchone()[0]
         sites = conn.execute(
             "SELECT site, COUNT(*) as n FROM vagas GROUP BY site ORDER BY n DESC"
@@ -162,33 +283,88 @@ def get_stats() -> dict:
 
 
 def delete_all() -> None:
-    """Remove todos os registros do histórico."""
-    init_db()
-    with _connect() as conn:
+    """Remove todos os registros do histórico e o cache das fontes."""
+    with _get_conn() as conn:
         conn.execute("DELETE FROM vagas")
+        conn.execute("DELETE FROM cache")
 
 
 def get_distinct_sites() -> list[str]:
     """Retorna lista de sites presentes no histórico."""
-    init_db()
-    with _connect() as conn:
+    with _get_conn() as conn:
         rows = conn.execute(
             "SELECT DISTINCT site FROM vagas WHERE site IS NOT NULL ORDER BY site"
         ).fetchall()
     return [r[0] for r in rows]
 
 
-# ── helpers ──────────────────────────────────────────────────────────────────
+def cache_key(*parts) -> str:
+    """Chave de cache estável para uma combinação de parâmetros."""
+    return hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()
+
 
-def _str(val) -> str | None:
-    if val is None:
+def cache_get(key: str, ttl_seconds: int):
+    """Retorna o valor guardado em key se tiver menos de ttl_seconds; senão None."""
+    try:
+        row = _get_conn().execute(
+            "SELECT ts, payload FROM cache WHERE key = ?", (key,)
+        ).fetchone()
+    except sqlite3.Error:
+        return None
+    if row is None or time.time() - row[0] >= ttl_seconds:
+        return None
+    try:
+        return pickle.loads(row[1])
+    except Exception:
         return None
-    s = str(val).strip()
-    return s if s not in ("", "nan", "None") else None
 
 
-def _float(val) -> float | None:
+def cache_put(key: str, value, ttl_seconds: int) -> None:
+    """Guarda value (pickle) em key por ttl_seconds; apaga as entradas vencidas."""
+    payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
     try:
-        return float(val)
-    except (TypeError, ValueError):
-        return None
+        now = int(time.time())
+        with _get_conn() as conn:
+            conn.execute("DELETE FROM cache WHERE ts + ttl <= ?", (now,))
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, ts, ttl, payload) VALUES (?, ?, ?, ?)",
+                (key, now, ttl_seconds, payload),
+            )
+    except sqlite3.Error:
+        pass
+
+
+# ── helpers ──────────────────────────────────────────────────────────────────
+
+def _fts_query(text: str) -> str:
+    """Converte texto livre em consulta FTS5: cada palavra vira um prefixo."""
+    return " ".join(f'"{word}"*' for word in re.findall(r"\w+", text))
+
+
+@lru_cache(maxsize=None)
+def _insert_sql(n_rows: int) -> str:
+    placeholders = "(" + ",".join("?" * len(_INSERT_COLUMNS)) + ")"
+    return (
+        f"INSERT OR IGNORE INTO vagas ({', '.join(_INSERT_COLUMNS)}) "
+        f"VALUES {','.join([placeholders] * n_rows)}"
+    )
+
+
+def _to_rows(df: pd.DataFrame, search_term: str, coleta: str) -> list[tuple]:
+    """Normaliza as colunas do DataFrame (vetorizado) e devolve as tuplas do INSERT."""
+    s = df.reindex(columns=list(_INSERT_COLUMNS))
+
+    for col in _TEXT_COLUMNS:
+        text = s[col].astype("string").str.strip()
+        s[col] = text.mask(text.isin(_NULL_TEXT))
+
+    for col in ("salario_min", "salario_max"):
+        s[col] = pd.to_numeric(s[col], errors="coerce")
+
+    s["remoto"] = (s["remoto"].notna() & s["remoto"].astype(bool)).astype("int8")
+    s["termo_busca"] = search_term
+    s["data_coleta"] = coleta
+
+    # NaN / pd.NA -> None (NULL no SQLite) e escalares numpy -> tipos Python
+    s = s.astype(object).where(s.notna(), None)
+    return list(s.itertuples(index=False, name=None))
@@ -10,11 +10,27 @@ from __future__ import annotations
 
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
 import pandas as pd
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson decodifica JSON bem mais rápido que o json da stdlib (opcional)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# lxml (parser em C) é bem mais rápido que o html.parser puro Python
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = "lxml"
+except ImportError:
+    _HTML_PARSER = "html.parser"
 
 _HEADERS = {
     "User-Agent": (
@@ -26,6 +42,8 @@ _HEADERS = {
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
 }
 
+_REMOTE_RE = re.compile(r"\bremoto\b|\bremote\b", re.IGNORECASE)
+
 _EMPTY_ROW: dict = {
     "site": None,
     "titulo": None,
@@ -47,12 +65,36 @@ def _row(**kwargs) -> dict:
     return {**_EMPTY_ROW, **kwargs}
 
 
-def _session() -> requests.Session:
+def make_session() -> requests.Session:
+    """Sessão HTTP com headers de navegador, pool de conexões e retry."""
     s = requests.Session()
     s.headers.update(_HEADERS)
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False,
+        ),
+    )
+    s.mount("http://", adapter)
+    s.mount("https://", adapter)
     return s
 
 
+# Sessão compartilhada por todos os scrapers: keep-alive + pool de conexões
+_SESSION = make_session()
+
+
+def _json(r: requests.Response):
+    """Corpo JSON da resposta — via orjson quando disponível."""
+    if orjson is not None:
+        return orjson.loads(r.content)
+    return r.json()
+
+
 def _date_from_iso(raw: str | None) -> str | None:
     if not raw:
         return None
@@ -70,60 +112,69 @@ def _date_from_epoch(ts) -> str | None:
 #  Gupy  (API pública)
 # ─────────────────────────────────────────────────────────────────────────────
 
-def scrape_gupy(search_term: str, results_wanted: int = 40, verbose: bool = True) -> pd.DataFrame:
+_GUPY_URL = "https://portal.api.gupy.io/api/v1/jobs"
+
+
+def _gupy_page(
+    session: requests.Session, search_term: str, limit: int, offset: int,
+) -> dict:
+    r = session.get(
+        _GUPY_URL,
+        params={"jobName": search_term, "limit": limit, "offset": offset},
+        timeout=15,
+    )
+    r.raise_for_status()
+    return _json(r)
+
+
+def scrape_gupy(
+    search_term: str,
+    results_wanted: int = 40,
+    verbose: bool = True,
+    session: requests.Session | None = None,
+) -> pd.DataFrame:
     """Vagas via API pública do Gupy (portal usado por centenas de empresas BR)."""
-    if verbose:
-        print(f"  -> Scraping Gupy...", end=" ", flush=True)
     try:
-        url = "https://portal.api.gupy.io/api/v1/jobs"
-        rows, offset, limit = [], 0, min(results_wanted, 40)
-
-        while len(rows) < results_wanted:
-            r = requests.get(
-                url,
-                params={"jobName": search_term, "limit": limit, "offset": offset},
-                headers=_HEADERS,
-                timeout=15,
-            )
-            r.raise_for_status()
-            body = r.json()
-            jobs = body.get("data", [])
-            if not jobs:
-                break
+        sess = session or _SESSION
+        limit = min(results_wanted, 40)
+
+        # A 1ª página informa o total; as demais são buscadas em paralelo
+        # (no máx. 4 simultâneas para não provocar 429)
+        first = _gupy_page(sess, search_term, limit, 0)
+        pages = [first]
+        offsets = range(limit, min(first.get("total", 0), results_wanted), limit)
+        if first.get("data") and offsets:
+            with ThreadPoolExecutor(max_workers=4) as ex:
+                pages += ex.map(lambda o: _gupy_page(sess, search_term, limit, o), offsets)
 
-            for job in jobs:
-                city  = job.get("city") or ""
-                state = job.get("state") or ""
-                loc   = ", ".join(p for p in [city, state, "Brazil"] if p)
-                wp    = (job.get("workplaceType") or "").lower()
-                comp  = job.get("company") or {}
-
-                rows.append(_row(
-                    site="gupy",
-                    titulo=job.get("name"),
-                    empresa=comp.get("name") if isinstance(comp, dict) else str(comp),
-                    localizacao=loc,
-                    remoto=wp in ("remote", "home_office", "hybrid"),
-                    tipo_vaga=job.get("type"),
-                    moeda="BRL",
-                    data_postagem=_date_from_iso(job.get("publishedDate")),
-                    link=job.get("jobUrl"),
-                    descricao=job.get("description"),
-                ))
+        rows = []
+        for job in (job for page in pages for job in page.get("data", [])):
+            city  = job.get("city") or ""
+            state = job.get("state") or ""
+            loc   = ", ".join(p for p in [city, state, "Brazil"] if p)
+            wp    = (job.get("workplaceType") or "").lower()
+            comp  = job.get("company") or {}
 
-            total = body.get("total", 0)
-            offset += limit
-            if offset >= total or offset >= results_wanted:
-                break
-            time.sleep(0.5)
+            rows.append(_row(
+                site="gupy",
+                titulo=job.get("name"),
+                empresa=comp.get("name") if isinstance(comp, dict) else str(comp),
+                localizacao=loc,
+                remoto=wp in ("remote", "home_office", "hybrid"),
+                tipo_vaga=job.get("type"),
+                moeda="BRL",
+                data_postagem=_date_from_iso(job.get("publishedDate")),
+                link=job.get("jobUrl"),
+                descricao=job.get("description"),
+            ))
 
         if verbose:
-            print(f"{len(rows)} vagas encontradas")
+            print(f"  -> Gupy: {len(rows)} vagas encontradas")
         return pd.DataFrame(rows[:results_wanted]) if rows else pd.DataFrame()
 
     except Exception as exc:
         if verbose:
-            print(f"ERRO ({exc})")
+            print(f"  -> Gupy: ERRO ({exc})")
         return pd.DataFrame()
 
 
@@ -131,19 +182,21 @@ def scrape_gupy(search_term: str, results_wanted: int = 40, verbose: bool = True
 #  RemoteOK  (API pública JSON)
 # ─────────────────────────────────────────────────────────────────────────────
 
-def scrape_remoteok(search_term: str, results_wanted: int = 30, verbose: bool = True) -> pd.DataFrame:
+def scrape_remoteok(
+    search_term: str,
+    results_wanted: int = 30,
+    verbose: bool = True,
+    session: requests.Session | None = None,
+) -> pd.DataFrame:
     """Vagas remotas via API pública do RemoteOK."""
-    if verbose:
-        print(f"  -> Scraping RemoteOK...", end=" ", flush=True)
     try:
         tag = "+".join(search_term.lower().split())
-        r = requests.get(
+        r = (session or _SESSION).get(
             f"https://remoteok.com/api?tags={tag}",
-            headers=_HEADERS,
             timeout=15,
         )
         r.raise_for_status()
-        data = r.json()
+        data = _json(r)
         jobs = [j for j in data if isinstance(j, dict) and j.get("id") and j.get("position")]
 
         rows = []
@@ -164,12 +217,12 @@ def scrape_remoteok(search_term: str, results_wanted: int = 30, verbose: bool =
             ))
 
         if verbose:
-            print(f"{len(rows)} vagas encontradas")
+            print(f"  -> RemoteOK: {len(rows)} vagas encontradas")
         return pd.DataFrame(rows) if rows else pd.DataFrame()
 
     except Exception as exc:
         if verbose:
-            print(f"ERRO ({exc})")
+            print(f"  -> RemoteOK: ERRO ({exc})")
         return pd.DataFrame()
 
 
@@ -177,17 +230,20 @@ def scrape_remoteok(search_term: str, results_wanted: int = 30, verbose: bool =
 #  Vagas.com  (HTML scraping)
 # ─────────────────────────────────────────────────────────────────────────────
 
-def scrape_vagascom(search_term: str, results_wanted: int = 30, verbose: bool = True) -> pd.DataFrame:
+def scrape_vagascom(
+    search_term: str,
+    results_wanted: int = 30,
+    verbose: bool = True,
+    session: requests.Session | None = None,
+) -> pd.DataFrame:
     """Vagas do maior job board brasileiro."""
-    if verbose:
-        print(f"  -> Scraping Vagas.com...", end=" ", flush=True)
     try:
         slug = "-".join(search_term.lower().split())
-        r = _session().get(
+        r = (session or _SESSION).get(
             f"https://www.vagas.com.br/vagas-de-{slug}",
             timeout=15,
         )
-        soup = BeautifulSoup(r.text, "html.parser")
+        soup = BeautifulSoup(r.content, _HTML_PARSER)
         rows = []
 
         for li in soup.select("li.vaga")[:results_wanted]:
@@ -211,12 +267,12 @@ def scrape_vagascom(search_term: str, results_wanted: int = 30, verbose: bool =
             ))
 
         if verbose:
-            print(f"{len(rows)} vagas encontradas")
+            print(f"  -> Vagas.com: {len(rows)} vagas encontradas")
         return pd.DataFrame(rows) if rows else pd.DataFrame()
 
     except Exception as exc:
         if verbose:
-            print(f"ERRO ({exc})")
+            print(f"  -> Vagas.com: ERRO ({exc})")
         return pd.DataFrame()
 
 
@@ -224,18 +280,21 @@ def scrape_vagascom(search_term: str, results_wanted: int = 30, verbose: bool =
 #  GeekHunter  (API JSON)
 # ─────────────────────────────────────────────────────────────────────────────
 
-def scrape_geekHunter(search_term: str, results_wanted: int = 30, verbose: bool = True) -> pd.DataFrame:
+def scrape_geekHunter(
+    search_term: str,
+    results_wanted: int = 30,
+    verbose: bool = True,
+    session: requests.Session | None = None,
+) -> pd.DataFrame:
     """Vagas de tech do GeekHunter via endpoint JSON."""
-    if verbose:
-        print(f"  -> Scraping GeekHunter...", end=" ", flush=True)
     try:
-        r = _session().get(
+        r = (session or _SESSION).get(
             "https://www.geekHunter.com.br/api/v1/opportunities/public_index",
             params={"q": search_term, "per_page": results_wanted, "page": 1},
             timeout=15,
         )
         r.raise_for_status()
-        body = r.json()
+        body = _json(r)
         jobs = (
             body.get("opportunities")
             or body.get("data")
@@ -266,12 +325,12 @@ def scrape_geekHunter(search_term: str, results_wanted: int = 30, verbose: bool
             ))
 
         if verbose:
-            print(f"{len(rows)} vagas encontradas")
+            print(f"  -> GeekHunter: {len(rows)} vagas encontradas")
         return pd.DataFrame(rows) if rows else pd.DataFrame()
 
     except Exception as exc:
         if verbose:
-            print(f"ERRO ({exc})")
+            print(f"  -> GeekHunter: ERRO ({exc})")
         return pd.DataFrame()
 
 
@@ -279,17 +338,20 @@ def scrape_geekHunter(search_term: str, results_wanted: int = 30, verbose: bool
 #  Trampos.co  (HTML scraping)
 # ─────────────────────────────────────────────────────────────────────────────
 
-def scrape_trampos(search_term: str, results_wanted: int = 30, verbose: bool = True) -> pd.DataFrame:
+def scrape_trampos(
+    search_term: str,
+    results_wanted: int = 30,
+    verbose: bool = True,
+    session: requests.Session | None = None,
+) -> pd.DataFrame:
     """Vagas de tech/criativo do Trampos.co."""
-    if verbose:
-        print(f"  -> Scraping Trampos.co...", end=" ", flush=True)
     try:
-        r = _session().get(
+        r = (session or _SESSION).get(
             "https://trampos.co/oportunidades",
             params={"term": search_term},
             timeout=15,
         )
-        soup = BeautifulSoup(r.text, "html.parser")
+        soup = BeautifulSoup(r.content, _HTML_PARSER)
         rows = []
 
         selectors = [
@@ -317,18 +379,18 @@ def scrape_trampos(search_term: str, results_wanted: int = 30, verbose: bool = T
                 titulo=title_text,
                 empresa=company_el.get_text(strip=True) if company_el else None,
                 localizacao=location_el.get_text(strip=True) if location_el else None,
-                remoto=bool(re.search(r"\bremoto\b|\bremote\b", title_text, re.I)),
+                remoto=bool(_REMOTE_RE.search(title_text)),
                 moeda="BRL",
                 link=f"https://trampos.co{href}" if href.startswith("/") else href,
             ))
 
         if verbose:
-            print(f"{len(rows)} vagas encontradas")
+            print(f"  -> Trampos.co: {len(rows)} vagas encontradas")
         return pd.DataFrame(rows) if rows else pd.DataFrame()
 
     except Exception as exc:
         if verbose:
-            print(f"ERRO ({exc})")
+            print(f"  -> Trampos.co: ERRO ({exc})")
         return pd.DataFrame()
 
 
@@ -337,22 +399,24 @@ def scrape_trampos(search_term: str, results_wanted: int = 30, verbose: bool = T
 # ─────────────────────────────────────────────────────────────────────────────
 
 _REDDIT_SUBS = ["brdev", "remotebrazil", "devBrasil"]
+_REDDIT_UA   = "VagasScrap/1.0 (job search aggregator)"
 _JOB_KWS     = ["vaga", "contrat", "hiring", "oportunidade", "emprego", "trabalho", "job"]
+_JOB_RE      = re.compile("|".join(map(re.escape, _JOB_KWS)), re.IGNORECASE)
 
 
-def scrape_reddit(search_term: str, results_wanted: int = 25, verbose: bool = True) -> pd.DataFrame:
+def scrape_reddit(
+    search_term: str,
+    results_wanted: int = 25,
+    verbose: bool = True,
+    session: requests.Session | None = None,
+) -> pd.DataFrame:
     """Posts de vagas nos subreddits brasileiros de devs."""
-    if verbose:
-        print(f"  -> Scraping Reddit (r/brdev ...)...", end=" ", flush=True)
     rows = []
     try:
-        sess = _session()
-        sess.headers["User-Agent"] = "VagasScrap/1.0 (job search aggregator)"
-
         for sub in _REDDIT_SUBS:
             if len(rows) >= results_wanted:
                 break
-            r = sess.get(
+            r = (session or _SESSION).get(
                 f"https://www.reddit.com/r/{sub}/search.json",
                 params={
                     "q": f"vaga {search_term}",
@@ -361,25 +425,26 @@ def scrape_reddit(search_term: str, results_wanted: int = 25, verbose: bool = Tr
                     "limit": 25,
                     "t": "month",
                 },
+                headers={"User-Agent": _REDDIT_UA},
                 timeout=15,
             )
             if r.status_code != 200:
                 continue
 
-            for post in r.json().get("data", {}).get("children", []):
+            for post in _json(r).get("data", {}).get("children", []):
                 d = post.get("data", {})
                 title = d.get("title", "")
                 body  = d.get("selftext", "")
-                combined = (title + " " + body).lower()
+                combined = title + " " + body
 
-                if not any(kw in combined for kw in _JOB_KWS):
+                if not _JOB_RE.search(combined):
                     continue
 
                 link = d.get("url") or f"https://reddit.com{d.get('permalink', '')}"
                 rows.append(_row(
                     site=f"reddit_r/{sub}",
                     titulo=title,
-                    remoto=bool(re.search(r"\bremoto\b|\bremote\b", combined)),
+                    remoto=bool(_REMOTE_RE.search(combined)),
                     tipo_vaga="Post",
                     data_postagem=_date_from_epoch(d.get("created_utc")),
                     link=link,
@@ -389,12 +454,12 @@ def scrape_reddit(search_term: str, results_wanted: int = 25, verbose: bool = Tr
             time.sleep(1)
 
         if verbose:
-            print(f"{len(rows)} posts encontrados")
+            print(f"  -> Reddit: {len(rows)} posts encontrados")
         return pd.DataFrame(rows[:results_wanted]) if rows else pd.DataFrame()
 
     except Exception as exc:
         if verbose:
-            print(f"ERRO ({exc})")
+            print(f"  -> Reddit: ERRO ({exc})")
         return pd.DataFrame()
 
 
@@ -402,17 +467,20 @@ def scrape_reddit(search_term: str, results_wanted: int = 25, verbose: bool = Tr
 #  Workana  (HTML scraping)
 # ─────────────────────────────────────────────────────────────────────────────
 
-def scrape_workana(search_term: str, results_wanted: int = 25, verbose: bool = True) -> pd.DataFrame:
+def scrape_workana(
+    search_term: str,
+    results_wanted: int = 25,
+    verbose: bool = True,
+    session: requests.Session | None = None,
+) -> pd.DataFrame:
     """Projetos/vagas freelance do Workana (BR/LATAM)."""
-    if verbose:
-        print(f"  -> Scraping Workana...", end=" ", flush=True)
     try:
-        r = _session().get(
+        r = (session or _SESSION).get(
             "https://www.workana.com/jobs",
             params={"search": search_term, "language": "pt"},
             timeout=15,
         )
-        soup = BeautifulSoup(r.text, "html.parser")
+        soup = BeautifulSoup(r.content, _HTML_PARSER)
         rows = []
 
         selectors = [
@@ -443,12 +511,12 @@ def scrape_workana(search_term: str, results_wanted: int = 25, verbose: bool = T
             ))
 
         if verbose:
-            print(f"{len(rows)} projetos encontrados")
+            print(f"  -> Workana: {len(rows)} projetos encontrados")
         return pd.DataFrame(rows) if rows else pd.DataFrame()
 
     except Exception as exc:
         if verbose:
-            print(f"ERRO ({exc})")
+            print(f"  -> Workana: ERRO ({exc})")
         return pd.DataFrame()
 
 
@@ -472,6 +540,7 @@ def search_extra(
     sources: list[str] | None = None,
     results_per_source: int = 25,
     verbose: bool = True,
+    session: requests.Session | None = None,
 ) -> pd.DataFrame:
     """
     Executa todos os scrapers extras selecionados e retorna DataFrame unificado.
@@ -481,23 +550,28 @@ def search_extra(
         sources: Chaves das fontes a usar (None = todas).
         results_per_source: Máximo de resultados por fonte.
         verbose: Imprimir progresso.
+        session: Sessão HTTP a reutilizar (None = sessão compartilhada do módulo).
     """
     if sources is None:
         sources = list(SCRAPERS.keys())
 
-    frames: list[pd.DataFrame] = []
-    for key in sources:
-        fn, _ = SCRAPERS.get(key, (None, None))
-        if fn is None:
-            continue
-        try:
-            df = fn(search_term, results_wanted=results_per_source, verbose=verbose)
-            if df is not None and not df.empty:
-                frames.append(df)
-        except Exception:
-            pass
-        time.sleep(0.5)
+    selected = [SCRAPERS[key][0] for key in sources if key in SCRAPERS]
+    if not selected:
+        return pd.DataFrame()
+
+    # Fontes independentes e limitadas por I/O: executa todas em paralelo.
+    # Os scrapers nunca levantam exceção e map devolve na ordem pedida
+    with ThreadPoolExecutor(max_workers=len(selected)) as ex:
+        results = ex.map(
+            lambda fn: fn(search_term, results_wanted=results_per_source,
+                          verbose=verbose, session=session),
+            selected,
+        )
+        frames = [df for df in results if df is not None and not df.empty]
 
     if not frames:
         return pd.DataFrame()
-    return pd.concat(frames, ignore_index=True, sort=False)
+    df = pd.concat(frames, ignore_index=True, sort=False)
+    # Coluna booleana de verdade (não object) para filtros vetorizados
+    df["remoto"] = df["remoto"].notna() & df["remoto"].astype(bool)
+    return df
@@ -5,17 +5,70 @@ filters.py - Filtros pós-scraping para o DataFrame de vagas
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 
 import pandas as pd
 
+# Com pyarrow instalado, str.contains roda no kernel de regex do Arrow (C++)
+# em vez de iterar objetos str do Python
+try:
+    import pyarrow  # noqa: F401
+    _TEXT_DTYPE = "string[pyarrow]"
+except ImportError:
+    _TEXT_DTYPE = "string[python]"
 
-def filter_by_skills(df: pd.DataFrame, skills: list[str]) -> pd.DataFrame:
+
+def _text_dtype(regex: re.Pattern) -> str:
+    """
+    Dtype da coluna de busca para regex.
+
+    Padrões com \\b ficam no re do Python: no RE2 do Arrow a fronteira de
+    palavra é só ASCII, e "çjr" casaria com \\bjr\\b.
+    """
+    return "string[python]" if r"\b" in regex.pattern else _TEXT_DTYPE
+
+
+def _search_text(df: pd.DataFrame, dtype: str = _TEXT_DTYPE) -> pd.Series:
+    """Título + descrição em uma única coluna, para uma só varredura de regex."""
+    parts = [df[col].astype(dtype).fillna("")
+             for col in ("titulo", "descricao") if col in df.columns]
+    if not parts:
+        return pd.Series("", index=df.index, dtype=dtype)
+    text = parts[0]
+    for part in parts[1:]:
+        text = text + " " + part
+    return text
+
+
+def _contains(df: pd.DataFrame, regex: re.Pattern, text: pd.Series | None) -> pd.Series:
+    """
+    Máscara de linhas de df cujo título/descrição casam com regex.
+
+    Reaproveita text quando já está no dtype certo para o padrão. Padrão em
+    texto + case=False (e não o objeto compilado) para que o backend Arrow
+    possa executar a busca sem voltar ao re do Python.
+    """
+    dtype = _text_dtype(regex)
+    if text is None or text.dtype != dtype:
+        text = _search_text(df, dtype)
+    else:
+        text = text.loc[df.index]
+    return text.str.contains(regex.pattern, case=False, regex=True, na=False)
+
+
+def filter_by_skills(
+    df: pd.DataFrame,
+    skills: list[str],
+    text: pd.Series | None = None,
+) -> pd.DataFrame:
     """
     Filtra vagas que contenham ao menos uma das skills no título ou descrição.
 
     Args:
         df: DataFrame de vagas.
         skills: Lista de skills (ex: ["python", "django", "fastapi"]).
+        text: Texto de busca já concatenado (ver _search_text); calculado
+            a partir de df quando omitido ou em outro dtype.
 
     Returns:
         DataFrame filtrado.
@@ -23,17 +76,11 @@ def filter_by_skills(df: pd.DataFrame, skills: list[str]) -> pd.DataFrame:
     if df.empty or not skills:
         return df
 
-    pattern = "|".join(re.escape(s.strip()) for s in skills if s.strip())
-    if not pattern:
+    regex = _skills_regex(tuple(sorted({s.strip() for s in skills if s.strip()})))
+    if regex is None:
         return df
 
-    regex = re.compile(pattern, re.IGNORECASE)
-
-    mask = pd.Series(False, index=df.index)
-
-    for col in ("titulo", "descricao"):
-        if col in df.columns:
-            mask |= df[col].fillna("").astype(str).str.contains(regex)
+    mask = _contains(df, regex, text)
 
     filtered = df[mask].copy()
     return filtered
@@ -55,7 +102,9 @@ def filter_remote(df: pd.DataFrame) -> pd.DataFrame:
     if "remoto" not in df.columns:
         return df
 
-    return df[df["remoto"] == True].copy()
+    # Máscara numpy direta (None/NaN contam como não-remoto); sem .copy() —
+    # apply_all_filters devolve um novo frame no reset_index final
+    return df[df["remoto"].to_numpy(dtype=bool, na_value=False)]
 
 
 def deduplicate(df: pd.DataFrame) -> pd.DataFrame:
@@ -140,13 +189,36 @@ SENIORITY_KEYWORDS: dict[str, list[str]] = {
 }
 
 
-def filter_by_seniority(df: pd.DataFrame, levels: list[str]) -> pd.DataFrame:
+@lru_cache(maxsize=None)
+def _skills_regex(skills: tuple[str, ...]) -> re.Pattern | None:
+    """Regex (compilada uma vez por conjunto de skills) que casa qualquer skill."""
+    if not skills:
+        return None
+    return re.compile("|".join(re.escape(s) for s in skills), re.IGNORECASE)
+
+
+@lru_cache(maxsize=None)
+def _seniority_regex(levels: frozenset[str]) -> re.Pattern | None:
+    """União (compilada uma vez) dos padrões dos níveis pedidos."""
+    patterns = [p for level in sorted(levels) for p in SENIORITY_KEYWORDS.get(level, [])]
+    if not patterns:
+        return None
+    return re.compile("|".join(patterns), re.IGNORECASE)
+
+
+def filter_by_seniority(
+    df: pd.DataFrame,
+    levels: list[str],
+    text: pd.Series | None = None,
+) -> pd.DataFrame:
     """
     Filtra vagas pelo nível de senioridade no título ou descrição.
 
     Args:
         df: DataFrame de vagas.
         levels: Níveis desejados (ex: ["junior", "pleno"]). Lista vazia = sem filtro.
+        text: Texto de busca já concatenado (ver _search_text); calculado
+            a partir de df quando omitido ou em outro dtype.
 
     Returns:
         DataFrame filtrado. Se levels estiver vazio, retorna df inteiro.
@@ -154,19 +226,11 @@ def filter_by_seniority(df: pd.DataFrame, levels: list[str]) -> pd.DataFrame:
     if df.empty or not levels:
         return df
 
-    patterns: list[str] = []
-    for level in levels:
-        patterns.extend(SENIORITY_KEYWORDS.get(level, []))
-
-    if not patterns:
+    regex = _seniority_regex(frozenset(levels))
+    if regex is None:
         return df
 
-    regex = re.compile("|".join(patterns), re.IGNORECASE)
-    mask = pd.Series(False, index=df.index)
-
-    for col in ("titulo", "descricao"):
-        if col in df.columns:
-            mask |= df[col].fillna("").astype(str).str.contains(regex)
+    mask = _contains(df, regex, text)
 
     return df[mask].copy()
 
@@ -192,21 +256,26 @@ def apply_all_filters(
     # Deduplicar job boards e posts separadamente para evitar que URLs do
     # LinkedIn (retornados pelo DDG) sejam removidos por colisão com URLs
     # idênticos já trazidos pelo JobSpy.
-    if "site" in df.columns:
-        is_post = df["site"].str.startswith("post_", na=False)
-        df_jobs = deduplicate(df[~is_post].copy())
-        df_posts = deduplicate(df[is_post].copy())
-        df = pd.concat([df_jobs, df_posts], ignore_index=True, sort=False)
+    if "site" in df.columns and "link" in df.columns:
+        df = (
+            df.assign(_is_post=df["site"].str.startswith("post_", na=False))
+            .drop_duplicates(subset=["link", "_is_post"], keep="first")
+            .drop(columns="_is_post")
+        )
     else:
         df = deduplicate(df)
 
     if remote_only:
         df = filter_remote(df)
 
+    # Título + descrição concatenados uma única vez para os filtros de texto;
+    # a senioridade (padrões com \b) só reaproveita a coluna se o dtype servir
+    text = _search_text(df) if skills else None
+
     if skills:
-        df = filter_by_skills(df, skills)
+        df = filter_by_skills(df, skills, text=text)
 
     if seniority:
-        df = filter_by_seniority(df, seniority)
+        df = filter_by_seniority(df, seniority, text=text)
 
     return df.reset_index(drop=True)
@@ -6,11 +6,13 @@ Inicie com: python gui.py  ou  abrir_gui.bat
 from __future__ import annotations
 
 import concurrent.futures
+import io
+import itertools
 import os
 import queue
-import sys
 import threading
 import webbrowser
+from contextlib import nullcontext, redirect_stdout
 from datetime import datetime
 from pathlib import Path
 from tkinter import ttk
@@ -19,24 +21,88 @@ import tkinter as tk
 import pandas as pd
 import customtkinter as ctk
 
+from extra_scrapers import make_session, search_extra
+from posts_scraper import search_posts
+from scraper import search_jobs
+
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
 
+LOG_MAX_LINES = 5000
+
 
 class QueueWriter:
     """Redireciona stdout para a fila de log."""
 
-    def __init__(self, q: queue.Queue):
+    def __init__(self, q: queue.Queue, root: tk.Misc | None = None):
         self.q = q
+        self.root = root
 
     def write(self, text: str):
         if text:
+            was_empty = self.q.empty()
             self.q.put(text)
+            # Avisa a janela só na transição vazia -> com itens; o handler
+            # esvazia a fila inteira de uma vez
+            if was_empty and self.root is not None:
+                try:
+                    self.root.event_generate("<<LogReady>>", when="tail")
+                except (tk.TclError, RuntimeError):
+                    # Janela destruída ou mainloop encerrado: o texto segue
+                    # só para a fila, sem esperar pelo Tk a cada print
+                    self.root = None
 
     def flush(self):
         pass
 
 
+def run_search_task(task: tuple, params: dict, capture: bool = False) -> tuple:
+    """
+    Executa uma tarefa de busca (label, kind, term, source).
+
+    Função de módulo (e não closure) para poder ser enviada a um
+    ProcessPoolExecutor. Com capture=True, o que a tarefa imprime é
+    devolvido em vez de ir para o stdout do processo.
+
+    Returns:
+        Tupla (DataFrame ou None, label, log capturado). None quando a
+        tarefa falha ou o tipo é desconhecido.
+    """
+    label, kind, term, source = task
+    buf = io.StringIO()
+    result = None
+    with redirect_stdout(buf) if capture else nullcontext():
+        try:
+            if kind == "jobspy":
+                result = search_jobs(
+                    search_term=term,
+                    location=params["location"],
+                    sites=[source],
+                    results_wanted=params["results_wanted"],
+                    hours_old=params["hours_old"],
+                    verbose=True,
+                )
+            elif kind == "extra":
+                result = search_extra(
+                    search_term=term,
+                    sources=[source],
+                    results_per_source=params["results_wanted"],
+                    verbose=True,
+                    session=params.get("session"),
+                )
+            elif kind == "posts":
+                result = search_posts(
+                    search_term=term,
+                    location=params["location"],
+                    platforms=[source],
+                    results_per_platform=15,
+                    verbose=True,
+                )
+        except Exception as exc:
+            print(f"  ERRO [{label}]: {exc}")
+    return result, label, buf.getvalue()
+
+
 class VagasScrapGUI(ctk.CTk):
     def __init__(self):
         super().__init__()
@@ -48,11 +114,26 @@ class VagasScrapGUI(ctk.CTk):
         self.is_running = False
         self.results_double_var = ctk.DoubleVar(value=25)
         self.extra_terms_list: list[str] = []
+        # Resolvida uma única vez (e não a cada abertura/gravação)
+        self.output_dir = Path("output").resolve()
+        self.output_dir.mkdir(exist_ok=True)
+        self._term_widgets: dict[str, ctk.CTkFrame] = {}
+        self._term_rows = itertools.count()
+        # Threads criadas uma vez e reaproveitadas por todas as buscas
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=8, thread_name_prefix="vagas")
 
         self._build_ui()
+        self.bind("<<LogReady>>", lambda e: self._drain_log_queue())
         self._poll_log_queue()
         self._log("VagasScrap iniciado. Configure a busca e clique em 'Buscar Vagas'.\n")
 
+    def destroy(self):
+        # Descarta as buscas ainda na fila ao fechar a janela; um atexit não
+        # serve, o concurrent.futures junta as threads antes de rodá-lo
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
+
     # ------------------------------------------------------------------ #
     #  Layout principal                                                    #
     # ------------------------------------------------------------------ #
@@ -129,10 +210,13 @@ class VagasScrapGUI(ctk.CTk):
         self._label(p, row, "Job boards")
         row += 1
         self.site_vars: dict[str, ctk.BooleanVar] = {}
+        self._selected_sites: set[str] = set()
         for site in ["linkedin", "indeed", "glassdoor"]:
             var = ctk.BooleanVar(value=True)
             self.site_vars[site] = var
-            ctk.CTkCheckBox(p, text=site.capitalize(), variable=var).grid(
+            self._selected_sites.add(site)
+            ctk.CTkCheckBox(p, text=site.capitalize(), variable=var,
+                            command=lambda k=site, v=var: self._toggle(self._selected_sites, k, v)).grid(
                 row=row, column=0, padx=28, pady=2, sticky="w")
             row += 1
         row += 1
@@ -145,6 +229,7 @@ class VagasScrapGUI(ctk.CTk):
             row=row, column=0, padx=18, pady=(0, 4), sticky="w")
         row += 1
         self.post_vars: dict[str, ctk.BooleanVar] = {}
+        self._selected_posts: set[str] = set()
         post_platforms = [
             ("linkedin_posts", "LinkedIn Posts"),
             ("twitter",        "Twitter / X"),
@@ -154,7 +239,8 @@ class VagasScrapGUI(ctk.CTk):
         for key, label in post_platforms:
             var = ctk.BooleanVar(value=False)
             self.post_vars[key] = var
-            ctk.CTkCheckBox(p, text=label, variable=var).grid(
+            ctk.CTkCheckBox(p, text=label, variable=var,
+                            command=lambda k=key, v=var: self._toggle(self._selected_posts, k, v)).grid(
                 row=row, column=0, padx=28, pady=2, sticky="w")
             row += 1
         row += 1
@@ -167,6 +253,7 @@ class VagasScrapGUI(ctk.CTk):
             row=row, column=0, padx=18, pady=(0, 4), sticky="w")
         row += 1
         self.extra_vars: dict[str, ctk.BooleanVar] = {}
+        self._selected_extra: set[str] = set()
         extra_sites = [
             ("gupy",       "Gupy",              True),
             ("remoteok",   "RemoteOK",           True),
@@ -179,7 +266,10 @@ class VagasScrapGUI(ctk.CTk):
         for key, label, default in extra_sites:
             var = ctk.BooleanVar(value=default)
             self.extra_vars[key] = var
-            ctk.CTkCheckBox(p, text=label, variable=var).grid(
+            if default:
+                self._selected_extra.add(key)
+            ctk.CTkCheckBox(p, text=label, variable=var,
+                            command=lambda k=key, v=var: self._toggle(self._selected_extra, k, v)).grid(
                 row=row, column=0, padx=28, pady=2, sticky="w")
             row += 1
         row += 1
@@ -200,13 +290,16 @@ class VagasScrapGUI(ctk.CTk):
         # ── Período ──────────────────────────────────────────────────────
         self._label(p, row, "Postadas nos últimos")
         row += 1
-        self.hours_var = ctk.StringVar(value="168")
+        # IntVar: o menu mostra texto, mas o valor já fica guardado como int
+        self.hours_var = ctk.IntVar(value=168)
         hours_frame = ctk.CTkFrame(p, fg_color="transparent")
         hours_frame.grid(row=row, column=0, padx=18, pady=(0, 12), sticky="ew")
         hours_frame.grid_columnconfigure(0, weight=1)
-        ctk.CTkOptionMenu(hours_frame,
-                          values=["24", "48", "72", "168", "336", "720"],
-                          variable=self.hours_var).grid(row=0, column=0, sticky="ew")
+        hours_menu = ctk.CTkOptionMenu(hours_frame,
+                                       values=["24", "48", "72", "168", "336", "720"],
+                                       command=lambda v: self.hours_var.set(int(v)))
+        hours_menu.set(str(self.hours_var.get()))
+        hours_menu.grid(row=0, column=0, sticky="ew")
         ctk.CTkLabel(hours_frame, text="horas  (168 = 7 dias)",
                      font=ctk.CTkFont(size=11), text_color="gray").grid(
             row=1, column=0, sticky="w", pady=(2, 0))
@@ -232,13 +325,15 @@ class VagasScrapGUI(ctk.CTk):
             row=row, column=0, padx=18, pady=(0, 4), sticky="w")
         row += 1
         self.seniority_vars: dict[str, ctk.BooleanVar] = {}
+        self._selected_seniority: set[str] = set()
         for key, label in [("trainee", "Trainee / Estágio"),
                             ("junior",  "Júnior"),
                             ("pleno",   "Pleno"),
                             ("senior",  "Sênior")]:
             var = ctk.BooleanVar(value=False)
             self.seniority_vars[key] = var
-            ctk.CTkCheckBox(p, text=label, variable=var).grid(
+            ctk.CTkCheckBox(p, text=label, variable=var,
+                            command=lambda k=key, v=var: self._toggle(self._selected_seniority, k, v)).grid(
                 row=row, column=0, padx=28, pady=2, sticky="w")
             row += 1
         row += 1
@@ -250,6 +345,12 @@ class VagasScrapGUI(ctk.CTk):
             row=row, column=0, padx=18, pady=(0, 12), sticky="w")
         row += 1
 
+        self.processes_var = ctk.BooleanVar(value=False)
+        ctk.CTkCheckBox(p, text="Parsing em processos paralelos",
+                        variable=self.processes_var).grid(
+            row=row, column=0, padx=18, pady=(0, 12), sticky="w")
+        row += 1
+
         # ── Formato ──────────────────────────────────────────────────────
         self._label(p, row, "Formato de saída")
         row += 1
@@ -353,36 +454,47 @@ class VagasScrapGUI(ctk.CTk):
                      font=ctk.CTkFont(weight="bold")).grid(
             row=row, column=0, padx=18, pady=(6, 2), sticky="w")
 
+    @staticmethod
+    def _toggle(selected: set[str], key: str, var: ctk.BooleanVar) -> None:
+        if var.get():
+            selected.add(key)
+        else:
+            selected.discard(key)
+
     def _add_extra_term(self):
         text = self.extra_term_entry.get().strip()
         if not text or text in self.extra_terms_list:
             return
         self.extra_terms_list.append(text)
         self.extra_term_entry.delete(0, "end")
-        self._refresh_extra_terms()
+        # Cria só a linha nova; as existentes permanecem intactas
+        self._term_widgets[text] = self._build_term_row(text)
 
     def _remove_extra_term(self, term: str):
         if term in self.extra_terms_list:
             self.extra_terms_list.remove(term)
-        self._refresh_extra_terms()
-
-    def _refresh_extra_terms(self):
-        for w in self.extra_terms_frame.winfo_children():
-            w.destroy()
-        for i, term in enumerate(self.extra_terms_list):
-            row_frame = ctk.CTkFrame(
-                self.extra_terms_frame, fg_color=("gray80", "gray25"), corner_radius=6)
-            row_frame.grid(row=i, column=0, sticky="ew", pady=2)
-            row_frame.grid_columnconfigure(0, weight=1)
-            ctk.CTkLabel(row_frame, text=term, anchor="w",
-                         font=ctk.CTkFont(size=12)).grid(
-                row=0, column=0, padx=8, pady=4, sticky="ew")
-            ctk.CTkButton(
-                row_frame, text="×", width=26, height=24,
-                fg_color="transparent", text_color="gray60",
-                hover_color=("gray70", "gray35"),
-                command=lambda t=term: self._remove_extra_term(t),
-            ).grid(row=0, column=1, padx=(0, 4))
+        widget = self._term_widgets.pop(term, None)
+        if widget is not None:
+            widget.destroy()
+
+    def _build_term_row(self, term: str) -> ctk.CTkFrame:
+        # Linhas do grid só crescem: buracos deixados por remoções não ocupam
+        # espaço, e novos termos sempre aparecem no fim
+        row = next(self._term_rows)
+        row_frame = ctk.CTkFrame(
+            self.extra_terms_frame, fg_color=("gray80", "gray25"), corner_radius=6)
+        row_frame.grid(row=row, column=0, sticky="ew", pady=2)
+        row_frame.grid_columnconfigure(0, weight=1)
+        ctk.CTkLabel(row_frame, text=term, anchor="w",
+                     font=ctk.CTkFont(size=12)).grid(
+            row=0, column=0, padx=8, pady=4, sticky="ew")
+        ctk.CTkButton(
+            row_frame, text="×", width=26, height=24,
+            fg_color="transparent", text_color="gray60",
+            hover_color=("gray70", "gray35"),
+            command=lambda t=term: self._remove_extra_term(t),
+        ).grid(row=0, column=1, padx=(0, 4))
+        return row_frame
 
     def _on_results_slider(self, value):
         self.results_label.configure(text=f"{int(value)} vagas")
@@ -390,6 +502,10 @@ class VagasScrapGUI(ctk.CTk):
     def _log(self, text: str):
         self.log_box.configure(state="normal")
         self.log_box.insert("end", text)
+        # Limita o tamanho do log: inserts no Text ficam mais lentos conforme cresce
+        lines = int(self.log_box.index("end-1c").split(".")[0])
+        if lines > LOG_MAX_LINES:
+            self.log_box.delete("1.0", f"end-{LOG_MAX_LINES}l")
         self.log_box.see("end")
         self.log_box.configure(state="disabled")
 
@@ -398,18 +514,25 @@ class VagasScrapGUI(ctk.CTk):
         self.log_box.delete("1.0", "end")
         self.log_box.configure(state="disabled")
 
-    def _poll_log_queue(self):
+    def _drain_log_queue(self):
+        # Junta tudo o que está na fila e faz um único insert no Textbox
+        chunks: list[str] = []
         try:
             while True:
-                self._log(self.log_queue.get_nowait())
+                chunks.append(self.log_queue.get_nowait())
         except queue.Empty:
             pass
-        self.after(100, self._poll_log_queue)
+        if chunks:
+            self._log("".join(chunks))
+
+    def _poll_log_queue(self):
+        # Rede de segurança lenta: o caminho normal é o evento <<LogReady>>;
+        # mensagens postas direto na fila (sem QueueWriter) chegam por aqui
+        self._drain_log_queue()
+        self.after(500, self._poll_log_queue)
 
     def _open_output(self):
-        out = Path("output")
-        out.mkdir(exist_ok=True)
-        os.startfile(str(out.resolve()))
+        os.startfile(self.output_dir)
 
     # ------------------------------------------------------------------ #
     #  Busca                                                               #
@@ -424,9 +547,11 @@ class VagasScrapGUI(ctk.CTk):
             self._log("\nERRO: Informe um termo de busca.\n")
             return
 
-        sites         = [s for s, v in self.site_vars.items()  if v.get()]
-        extra_sources = [k for k, v in self.extra_vars.items() if v.get()] or None
-        post_platforms = [k for k, v in self.post_vars.items()  if v.get()] or None
+        # Seleções mantidas pelos callbacks dos checkboxes (sem .get() no
+        # Tcl aqui); a ordem segue a dos checkboxes
+        sites         = [k for k in self.site_vars  if k in self._selected_sites]
+        extra_sources = [k for k in self.extra_vars if k in self._selected_extra] or None
+        post_platforms = [k for k in self.post_vars  if k in self._selected_posts] or None
 
         if not sites and not extra_sources and not post_platforms:
             self._log("\nERRO: Selecione ao menos uma fonte de busca.\n")
@@ -434,7 +559,7 @@ class VagasScrapGUI(ctk.CTk):
 
         skills_raw = self.skills_entry.get().strip()
         skills    = [s.strip() for s in skills_raw.split(",") if s.strip()] or None
-        seniority = [k for k, v in self.seniority_vars.items() if v.get()] or None
+        seniority = [k for k in self.seniority_vars if k in self._selected_seniority] or None
 
         params = {
             "search_terms":  [term] + self.extra_terms_list,
@@ -442,12 +567,13 @@ class VagasScrapGUI(ctk.CTk):
             "sites":         sites,
             "extra_sources": extra_sources,
             "results_wanted": int(self.results_double_var.get()),
-            "hours_old":     int(self.hours_var.get()),
+            "hours_old":     self.hours_var.get(),
             "skills":        skills,
             "seniority":     seniority,
             "remote_only":   self.remote_var.get(),
             "fmt":           self.format_var.get(),
             "post_platforms": post_platforms,
+            "use_processes": self.processes_var.get(),
         }
 
         self.is_running = True
@@ -457,14 +583,16 @@ class VagasScrapGUI(ctk.CTk):
         threading.Thread(target=self._run_search, args=(params,), daemon=True).start()
 
     def _run_search(self, params: dict):
-        old_stdout = sys.stdout
-        sys.stdout = QueueWriter(self.log_queue)
-
+        session = None
         try:
             from database import save_jobs
             from filters import apply_all_filters
             from recruiter import enrich_recruiter_info
 
+            # Uma sessão HTTP (keep-alive + pool) para todas as tarefas da busca
+            session = make_session()
+            params["session"] = session
+
             self.log_queue.put("\n" + "─" * 52 + "\n")
             self.log_queue.put(
                 f"Iniciando busca: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}\n")
@@ -486,67 +614,81 @@ class VagasScrapGUI(ctk.CTk):
             self.log_queue.put(f"Executando {total} buscas em paralelo...\n")
             self.after(0, lambda: self._show_progress(total))
 
-            completed_count = 0
-            lock = threading.Lock()
-
-            def run_task(task: tuple) -> pd.DataFrame:
-                nonlocal completed_count
-                label, kind, term, source = task
-                result = pd.DataFrame()
-                try:
-                    if kind == "jobspy":
-                        from scraper import search_jobs
-                        result = search_jobs(
-                            search_term=term,
-                            location=params["location"],
-                            sites=[source],
-                            results_wanted=params["results_wanted"],
-                            hours_old=params["hours_old"],
-                            verbose=True,
-                        )
-                    elif kind == "extra":
-                        from extra_scrapers import search_extra
-                        result = search_extra(
-                            search_term=term,
-                            sources=[source],
-                            results_per_source=params["results_wanted"],
-                            verbose=True,
-                        )
-                    elif kind == "posts":
-                        from posts_scraper import search_posts
-                        result = search_posts(
-                            search_term=term,
-                            location=params["location"],
-                            platforms=[source],
-                            results_per_platform=15,
-                            verbose=True,
-                        )
-                except Exception as exc:
-                    self.log_queue.put(f"  ERRO [{label}]: {exc}\n")
-
-                with lock:
-                    completed_count += 1
-                    c = completed_count
-                self.after(0, lambda c=c: self._update_progress(c, total))
-                return result
-
-            max_workers = min(8, total) if total else 1
-            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-                results = list(executor.map(run_task, tasks))
-
-            all_frames = [df for df in results if df is not None and not df.empty]
-            df = pd.concat(all_frames, ignore_index=True, sort=False) if all_frames else pd.DataFrame()
+            # Threads bastam para a espera de rede; com use_processes o
+            # parsing (BeautifulSoup/regex) roda em paralelo de verdade, fora
+            # do GIL. Processos não recebem a sessão HTTP (não é picklável
+            # de forma útil) e devolvem o log capturado junto com o resultado.
+            use_processes = params["use_processes"]
+            if use_processes:
+                task_params = {k: v for k, v in params.items() if k != "session"}
+                max_workers = min(os.cpu_count() or 1, total) if total else 1
+                pool = concurrent.futures.ProcessPoolExecutor(max_workers=max_workers)
+            else:
+                # Pool de threads da janela, reaproveitado entre buscas
+                task_params = params
+                pool = nullcontext(self.executor)
+
+            # Progresso avisado pelo próprio future ao terminar: next() em
+            # itertools.count é atômico sob o GIL, sem lock nem nonlocal
+            counter = itertools.count(1)
+
+            def _done(_fut: concurrent.futures.Future) -> None:
+                c = next(counter)
+                self.after(0, lambda: self._update_progress(c, total))
+
+            # Consome cada resultado assim que a fonte termina; frames vazios
+            # são descartados
+            all_frames: list[pd.DataFrame] = []
+            # stdout vai para o log só enquanto os scrapers rodam; o
+            # redirect_stdout restaura o original mesmo se algo falhar
+            with redirect_stdout(QueueWriter(self.log_queue, root=self)), pool as executor:
+                futures = []
+                for t in tasks:
+                    fut = executor.submit(run_search_task, t, task_params, use_processes)
+                    fut.add_done_callback(_done)
+                    futures.append(fut)
+                for fut in concurrent.futures.as_completed(futures):
+                    result, _, logs = fut.result()
+                    if logs:
+                        self.log_queue.put(logs)
+                    if result is not None and not result.empty:
+                        all_frames.append(result)
+
+            df = (pd.concat(all_frames, ignore_index=True, sort=False)
+                  if all_frames else pd.DataFrame())
 
             if df.empty:
                 self.log_queue.put("\nNenhuma vaga encontrada.\n")
                 self.after(0, lambda: self.status_var.set("Nenhuma vaga encontrada."))
                 return
 
+            # Poucos valores distintos: site vira category (códigos int8) e
+            # remoto um bool nativo, em vez de colunas object
+            if "site" in df.columns:
+                df["site"] = df["site"].astype("category")
+            if "remoto" in df.columns:
+                df["remoto"] = df["remoto"].notna() & df["remoto"].astype(bool)
+
+            # A mesma vaga costuma aparecer em vários sites/termos: descarta as
+            # repetidas antes do enriquecimento, que é a etapa mais cara. Só
+            # vagas (não posts) com título e empresa: chaves nulas não
+            # identificam a vaga e o pandas as trataria como iguais
+            if {"titulo", "empresa"} <= set(df.columns):
+                key_cols = [c for c in ("titulo", "empresa", "localizacao") if c in df.columns]
+                is_post = (df["site"].str.startswith("post_", na=False)
+                           if "site" in df.columns else False)
+                eligible = ~is_post & df["titulo"].notna() & df["empresa"].notna()
+                dup = df.loc[eligible, key_cols].duplicated()
+                if dup.any():
+                    df = df.drop(index=dup.index[dup]).reset_index(drop=True)
+                    self.log_queue.put(
+                        f"Duplicadas entre fontes removidas: {int(dup.sum())}\n")
+
             # Enriquecer com dados do recrutador
             self.log_queue.put("\nExtraindo informações de recrutadores...\n")
             df = enrich_recruiter_info(df)
-            with_email = df["email_recrutador"].notna().sum()
-            with_name = df["nome_recrutador"].notna().sum()
+            counts = df[["email_recrutador", "nome_recrutador"]].notna().sum()
+            with_email, with_name = counts["email_recrutador"], counts["nome_recrutador"]
             self.log_queue.put(
                 f"  Emails encontrados: {with_email} | Nomes encontrados: {with_name}\n")
 
@@ -568,7 +710,8 @@ class VagasScrapGUI(ctk.CTk):
             self.log_queue.put(f"Histórico: {new_in_db} nova(s) vaga(s) adicionada(s)\n")
 
             # Salvar arquivo
-            out_dir = Path("output")
+            out_dir = self.output_dir
+            # A pasta pode ter sido apagada com o app aberto
             out_dir.mkdir(exist_ok=True)
             timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M")
             slug = search_terms[0].replace(" ", "_")[:25]
@@ -576,7 +719,7 @@ class VagasScrapGUI(ctk.CTk):
 
             if params["fmt"] == "excel":
                 out_path = out_dir / f"{name}.xlsx"
-                df.to_excel(out_path, index=False)
+                df.to_excel(out_path, index=False, engine="xlsxwriter")
             else:
                 out_path = out_dir / f"{name}.csv"
                 df.to_csv(out_path, index=False, encoding="utf-8-sig")
@@ -594,7 +737,8 @@ class VagasScrapGUI(ctk.CTk):
             self.after(0, lambda: self.status_var.set("Erro durante a busca."))
 
         finally:
-            sys.stdout = old_stdout
+            if session is not None:
+                session.close()
             self.is_running = False
             self.after(0, self._hide_progress)
             self.after(0, lambda: self.search_btn.configure(
@@ -728,17 +872,27 @@ class VagasScrapGUI(ctk.CTk):
                      font=ctk.CTkFont(size=11)).pack(side="left", padx=12, pady=10)
 
         def _export():
-            from database import load_history
-            df = load_history(search_filter=search_var.get(),
-                              site_filter=site_filter_var.get())
-            if df.empty:
-                return
-            out = Path("output")
-            out.mkdir(exist_ok=True)
-            ts = datetime.now().strftime("%Y-%m-%d_%H-%M")
-            path = out / f"historico_{ts}.csv"
-            df.to_csv(path, index=False, encoding="utf-8-sig")
-            os.startfile(str(out.resolve()))
+            # Consulta e gravação rodam numa thread; a janela segue responsiva
+            search_filter = search_var.get()
+            site_filter = site_filter_var.get()
+            export_btn.configure(state="disabled", text="Exportando...")
+
+            def _worker():
+                from database import load_history
+                out = self.output_dir
+                try:
+                    df = load_history(search_filter=search_filter, site_filter=site_filter)
+                    if not df.empty:
+                        out.mkdir(exist_ok=True)
+                        ts = datetime.now().strftime("%Y-%m-%d_%H-%M")
+                        path = out / f"historico_{ts}.csv"
+                        df.to_csv(path, index=False, encoding="utf-8-sig", chunksize=10000)
+                        self.after(0, lambda: os.startfile(out))
+                finally:
+                    self.after(0, lambda: export_btn.configure(
+                        state="normal", text="Exportar CSV"))
+
+            threading.Thread(target=_worker, daemon=True).start()
 
         def _clear_all():
             import tkinter.messagebox as mb
@@ -749,44 +903,82 @@ class VagasScrapGUI(ctk.CTk):
                 delete_all()
                 _load_data()
 
-        ctk.CTkButton(bottom, text="Exportar CSV", width=120, height=30,
-                      command=_export).pack(side="right", padx=(0, 8), pady=7)
+        export_btn = ctk.CTkButton(bottom, text="Exportar CSV", width=120, height=30,
+                                   command=_export)
+        export_btn.pack(side="right", padx=(0, 8), pady=7)
         ctk.CTkButton(bottom, text="Limpar histórico", width=130, height=30,
                       fg_color="#8b1a1a", hover_color="#6b1010",
                       command=_clear_all).pack(side="right", padx=(0, 6), pady=7)
 
         # ── Carregar dados ────────────────────────────────────────────────
+        # Busca e site são resolvidos no SQLite (FTS5 + índices), sobre o
+        # histórico inteiro e não só as linhas carregadas; a busca textual
+        # recarrega com debounce para não consultar a cada tecla
+        history_rows: list[str] = []
+        # DataFrame carregado, alinhado posição a posição com history_rows
+        history_df: dict[str, pd.DataFrame] = {"df": pd.DataFrame()}
+        pending_load: list[str] = []
+
         def _load_data(*_):
             from database import load_history
+            # Cancela o debounce pendente: sem isso a mudança de site
+            # recarregaria agora e de novo quando o timer disparasse
+            if pending_load:
+                win.after_cancel(pending_load.pop())
             df = load_history(search_filter=search_var.get(),
                               site_filter=site_filter_var.get())
-            tree.delete(*tree.get_children())
-            for _, row in df.iterrows():
-                remoto = "Sim" if row.get("remoto") else "Não"
-                values = (
-                    str(row.get("data_coleta") or "")[:16],
-                    str(row.get("site") or ""),
-                    str(row.get("titulo") or ""),
-                    str(row.get("empresa") or ""),
-                    str(row.get("localizacao") or ""),
-                    remoto,
-                    str(row.get("nome_recrutador") or ""),
-                    str(row.get("email_recrutador") or ""),
-                )
-                link = str(row.get("link") or "")
-                tree.insert("", "end", values=values, tags=(link,))
-            count_var.set(f"{len(df)} vagas exibidas")
+            # Sem scrollbar ligada durante a carga: nada de atualizar a
+            # barra a cada insert; religada ao final
+            tree.configure(yscrollcommand="", xscrollcommand="")
+            tree.delete(*history_rows)
+            history_rows.clear()
+            # Todas as conversões (str, fatia da data, Sim/Não) feitas por
+            # coluna antes do laço, que só faz tree.insert
+            def text(col: str) -> pd.Series:
+                return df[col].fillna("").astype(str)
+
+            view = pd.DataFrame({
+                "data_coleta": text("data_coleta").str[:16],
+                "site": text("site"),
+                "titulo": text("titulo"),
+                "empresa": text("empresa"),
+                "localizacao": text("localizacao"),
+                "remoto": df["remoto"].fillna(0).astype(bool).map({True: "Sim", False: "Não"}),
+                "nome_recrutador": text("nome_recrutador"),
+                "email_recrutador": text("email_recrutador"),
+                "link": text("link"),
+            })
+            for r in view.itertuples(index=False, name=None):
+                history_rows.append(tree.insert("", "end", values=r[:-1], tags=(r[-1],)))
+            history_df["df"] = df
+            count_var.set(f"{len(history_rows)} vagas exibidas")
+            tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+
+        def _schedule_load(*_):
+            # Debounce: só consulta 200 ms depois da última tecla
+            if pending_load:
+                win.after_cancel(pending_load.pop())
+            pending_load.append(win.after(200, _load_data))
 
         def _sort_tree(tv, col, reverse):
-            data = [(tv.set(k, col), k) for k in tv.get_children("")]
-            data.sort(reverse=reverse)
-            for i, (_, k) in enumerate(data):
-                tv.move(k, "", i)
+            # Ordena o DataFrame (as colunas da árvore têm os nomes das colunas
+            # do banco) e reordena os itens já existentes num único
+            # set_children, sem tv.set/tv.move por linha
+            df = history_df["df"]
+            order = df[col].reset_index(drop=True).sort_values(
+                ascending=not reverse, kind="stable", na_position="last").index
+            history_df["df"] = df.iloc[order].reset_index(drop=True)
+            history_rows[:] = [history_rows[i] for i in order]
+            tv.set_children("", *history_rows)
             tv.heading(col, command=lambda: _sort_tree(tv, col, not reverse))
 
-        # Filtros disparam recarga
-        search_var.trace_add("write", _load_data)
+        def _on_destroy(event):
+            if event.widget is win and pending_load:
+                win.after_cancel(pending_load.pop())
+
+        search_var.trace_add("write", _schedule_load)
         site_filter_var.trace_add("write", _load_data)
+        win.bind("<Destroy>", _on_destroy, add="+")
 
         _load_data()
 
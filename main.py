@@ -31,6 +31,8 @@ def cmd_search(args: argparse.Namespace) -> None:
         results_wanted=args.results,
         hours_old=args.hours_old,
         verbose=True,
+        # Só o filtro de skills lê a descrição; remoto é uma coluna própria
+        fetch_description=args.descriptions or bool(skills),
     )
 
     if df.empty:
@@ -58,7 +60,6 @@ def cmd_schedule(args: argparse.Namespace) -> None:
 
 def cmd_config(args: argparse.Namespace) -> None:
     import yaml
-    from pathlib import Path
 
     config_path = Path(args.config)
     if not config_path.exists():
@@ -74,8 +75,6 @@ def cmd_config(args: argparse.Namespace) -> None:
 
 def _print_summary(df) -> None:
     """Exibe um resumo das vagas encontradas no terminal."""
-    import pandas as pd
-
     print("\n" + "=" * 70)
     print(f"{'SITE':<12} {'TÍTULO':<35} {'EMPRESA':<20}")
     print("=" * 70)
@@ -109,7 +108,7 @@ def _save_output(df, args: argparse.Namespace) -> Path:
 
     if fmt == "excel":
         out_path = out_dir / f"{filename}.xlsx"
-        df.to_excel(out_path, index=False)
+        df.to_excel(out_path, index=False, engine="xlsxwriter")
     else:
         out_path = out_dir / f"{filename}.csv"
         df.to_csv(out_path, index=False, encoding="utf-8-sig")
@@ -128,6 +127,7 @@ Exemplos:
   python main.py search -s "react" -l "São Paulo" --skills "react,typescript" --remote
   python main.py search -s "data scientist" --sites linkedin indeed --results 50
   python main.py search -s "engenheiro" --format excel
+  python main.py search -s "golang" --sites linkedin --descriptions
   python main.py schedule
   python main.py config
         """,
@@ -182,6 +182,12 @@ Exemplos:
         action="store_true",
         help="Filtrar apenas vagas remotas",
     )
+    search_parser.add_argument(
+        "--descriptions",
+        action="store_true",
+        help="Buscar a descrição completa das vagas do LinkedIn (padrão: "
+             "só com --skills; sem ela a coluna descricao do LinkedIn fica vazia)",
+    )
     search_parser.add_argument(
         "--format",
         choices=["csv", "excel"],
@@ -12,11 +12,12 @@ Plataformas suportadas:
 from __future__ import annotations
 
 import re
-import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import pandas as pd
 
+from database import cache_get, cache_key, cache_put
+
 # ── Configuração de plataformas ───────────────────────────────────────────────
 
 PLATFORMS: dict[str, dict] = {
@@ -63,16 +64,39 @@ _EMAIL_RE = re.compile(
 )
 
 
+# Campos usados de cada resultado do DDGS.text() e seus nomes no DataFrame
+_DDG_RENAME = {"title": "titulo", "href": "link", "body": "descricao", "published": "data"}
+_DDG_FIELDS = list(_DDG_RENAME)
+
+
 def _build_query(search_term: str, location: str, site_filter: str) -> str:
     phrases = " OR ".join(f'"{p}"' for p in _JOB_PHRASES[:6])
     loc = location.split(",")[0].strip()  # "Rio de Janeiro, Brazil" → "Rio de Janeiro"
     return f"({phrases}) {search_term} {loc} {site_filter}"
 
 
-def _extract_email(text: str) -> str | None:
-    found = _EMAIL_RE.findall(text or "")
-    filtered = [e for e in found if not e.endswith((".png", ".jpg", ".gif", ".svg"))]
-    return filtered[0] if filtered else None
+def _extract_emails(text: pd.Series) -> pd.Series:
+    """Primeiro e-mail (que não seja de imagem) de cada texto, vetorizado."""
+    found = text.str.extractall(f"({_EMAIL_RE.pattern})", flags=re.IGNORECASE)[0]
+    found = found[~found.str.endswith((".png", ".jpg", ".gif", ".svg"))]
+    return found.groupby(level=0).first().reindex(text.index)
+
+
+def _fetch_platform(ddgs_cls, query: str, max_results: int, cache_ttl: int) -> list[dict]:
+    """
+    Executa uma consulta no DuckDuckGo com sessão própria (uma por thread).
+    Resultados com menos de cache_ttl segundos vêm do cache em disco.
+    """
+    key = cache_key("ddg", query, max_results)
+    if cache_ttl:
+        cached = cache_get(key, cache_ttl)
+        if cached is not None:
+            return cached
+    with ddgs_cls() as ddgs:
+        results = list(ddgs.text(query, max_results=max_results))
+    if cache_ttl and results:
+        cache_put(key, results, cache_ttl)
+    return results
 
 
 def search_posts(
@@ -81,6 +105,7 @@ def search_posts(
     platforms: list[str] | None = None,
     results_per_platform: int = 15,
     verbose: bool = True,
+    cache_ttl: int = 3600,
 ) -> pd.DataFrame:
     """
     Busca posts de recrutadores sobre vagas em redes sociais via DuckDuckGo.
@@ -91,6 +116,8 @@ def search_posts(
         platforms: Lista de plataformas. Padrão: linkedin_posts, twitter.
         results_per_platform: Máximo de resultados por plataforma.
         verbose: Imprimir progresso.
+        cache_ttl: Segundos em que uma consulta repetida é servida do cache
+            (0 = sempre consultar).
 
     Returns:
         DataFrame no mesmo formato das vagas do JobSpy, com coluna
@@ -110,64 +137,61 @@ def search_posts(
     if invalid:
         raise ValueError(f"Plataformas inválidas: {invalid}. Válidas: {list(PLATFORMS)}")
 
-    all_rows: list[dict] = []
-
-    for platform_key in platforms:
-        cfg = PLATFORMS[platform_key]
-        label = cfg["label"]
-
-        if verbose:
-            print(f"  -> Buscando posts em {label}...", end=" ", flush=True)
-
-        query = _build_query(search_term, location, cfg["site_filter"])
-
-        try:
-            with DDGS() as ddgs:
-                results = list(ddgs.text(query, max_results=results_per_platform))
-
-            count = len(results)
+    # Uma consulta por plataforma, todas em paralelo (DDGS é bloqueante e
+    # cada thread usa a própria sessão)
+    fetched: dict[str, list[dict]] = {}
+    with ThreadPoolExecutor(max_workers=len(platforms) or 1) as ex:
+        futures = {
+            ex.submit(
+                _fetch_platform, DDGS,
+                _build_query(search_term, location, PLATFORMS[key]["site_filter"]),
+                results_per_platform, cache_ttl,
+            ): key
+            for key in platforms
+        }
+        for fut in as_completed(futures):
+            key = futures[fut]
+            label = PLATFORMS[key]["label"]
+            try:
+                fetched[key] = fut.result()
+            except Exception as exc:
+                if verbose:
+                    print(f"  -> {label}: ERRO ({exc})")
+                continue
             if verbose:
-                print(f"{count} posts encontrados")
-
-            for r in results:
-                snippet = r.get("body", "") or ""
-                title = r.get("title", "") or ""
-                link = r.get("href", "") or ""
-                date_str = r.get("published", "") or ""
-
-                # Tenta normalizar a data
-                data_postagem = None
-                if date_str:
-                    try:
-                        data_postagem = datetime.fromisoformat(
-                            date_str.replace("Z", "+00:00")
-                        ).strftime("%Y-%m-%d")
-                    except ValueError:
-                        data_postagem = date_str[:10] if len(date_str) >= 10 else None
-
-                all_rows.append({
-                    "site": f"post_{platform_key}",
-                    "titulo": title,
-                    "empresa": None,
-                    "localizacao": None,
-                    "remoto": False,
-                    "tipo_vaga": "Post",
-                    "salario_min": None,
-                    "salario_max": None,
-                    "moeda": None,
-                    "data_postagem": data_postagem,
-                    "link": link,
-                    "emails": _extract_email(snippet),
-                    "descricao": snippet,
-                })
-
-        except Exception as exc:
-            if verbose:
-                print(f"ERRO ({exc})")
-
-        time.sleep(1.5)
-
-    if not all_rows:
+                print(f"  -> {label}: {len(fetched[key])} posts encontrados")
+
+    # Um DataFrame por plataforma direto dos registros do DDG (sem dict por
+    # linha); e-mail e data são tratados depois, vetorizados sobre o todo.
+    # Mantém a ordem das plataformas pedidas
+    frames = [
+        pd.DataFrame.from_records(fetched[key], columns=_DDG_FIELDS)
+        .fillna("")
+        .assign(site=f"post_{key}")
+        for key in platforms if fetched.get(key)
+    ]
+
+    if not frames:
         return pd.DataFrame()
 
-    return pd.DataFrame(all_rows)
+    raw = pd.concat(frames, ignore_index=True).rename(columns=_DDG_RENAME)
+
+    # Datas ISO: a parte YYYY-MM-DD são os 10 primeiros caracteres
+    dates = raw["data"]
+    data_postagem = dates.str[:10].where(dates.str.len() >= 10)
+
+    return pd.DataFrame({
+        "site": raw["site"],
+        "titulo": raw["titulo"],
+        "empresa": None,
+        "localizacao": None,
+        "remoto": False,
+        "tipo_vaga": "Post",
+        "salario_min": None,
+        "salario_max": None,
+        "moeda": None,
+        "data_postagem": data_postagem,
+        "link": raw["link"],
+        "emails": _extract_emails(raw["descricao"]),
+        "descricao": raw["descricao"],
+    })
@@ -14,51 +14,43 @@ _EMAIL_RE = re.compile(
     re.IGNORECASE,
 )
 
-# Padrões para capturar nome do recrutador na descrição
-_NAME_PATTERNS = [
-    # PT: "Recrutador(a): Nome Sobrenome"
-    r"recrut[ao]dor[a]?\s*[:：]\s*([A-ZÀ-Ú][a-zà-ú]+(?:\s+[A-ZÀ-Ú][a-zà-ú]+){1,3})",
-    # PT: "Contato: Nome Sobrenome"
-    r"contato\s*[:：]\s*([A-ZÀ-Ú][a-zà-ú]+(?:\s+[A-ZÀ-Ú][a-zà-ú]+){1,3})",
-    # EN: "Posted by Nome Sobrenome"
-    r"posted\s+by\s+([A-ZÀ-Ú][a-zà-ú]+(?:\s+[A-ZÀ-Ú][a-zà-ú]+){1,3})",
-    # EN: "Hiring Manager: Nome"
-    r"hiring\s+manager\s*[:：]\s*([A-ZÀ-Ú][a-zà-ú]+(?:\s+[A-ZÀ-Ú][a-zà-ú]+){1,3})",
-    # EN: "Contact Nome at"
-    r"contact\s+([A-ZÀ-Ú][a-zà-ú]+(?:\s+[A-ZÀ-Ú][a-zà-ú]+){1,3})\s+at\b",
-    # EN: "Recruiter: Nome"
-    r"recruiter\s*[:：]\s*([A-ZÀ-Ú][a-zà-ú]+(?:\s+[A-ZÀ-Ú][a-zà-ú]+){1,3})",
-    # PT/EN: "Responsável: Nome"
-    r"respons[aá]vel\s*[:：]\s*([A-ZÀ-Ú][a-zà-ú]+(?:\s+[A-ZÀ-Ú][a-zà-ú]+){1,3})",
-    # LinkedIn "Apply to Nome Sobrenome"
-    r"apply\s+to\s+([A-ZÀ-Ú][a-zà-ú]+(?:\s+[A-ZÀ-Ú][a-zà-ú]+){1,3})",
+# Nome próprio: 2 a 4 palavras capitalizadas. O lookahead impede que a
+# última "palavra" seja o início de um e-mail colado ao nome
+# ("Ana Souza ana.souza@..."), que a busca combinada abaixo precisa capturar
+_NAME_WORD = r"(?![\w.%+\-]*@)[A-ZÀ-Ú][a-zà-ú]+"
+_PERSON = rf"{_NAME_WORD}(?:\s+{_NAME_WORD}){{1,3}}"
+
+# Rótulos que precedem o nome do recrutador na descrição
+_NAME_PREFIXES = [
+    r"recrut[ao]dor[a]?\s*[:：]\s*",       # PT: "Recrutador(a): Nome Sobrenome"
+    r"contato\s*[:：]\s*",                  # PT: "Contato: Nome Sobrenome"
+    r"posted\s+by\s+",                      # EN: "Posted by Nome Sobrenome"
+    r"hiring\s+manager\s*[:：]\s*",        # EN: "Hiring Manager: Nome"
+    r"recruiter\s*[:：]\s*",                # EN: "Recruiter: Nome"
+    r"respons[aá]vel\s*[:：]\s*",           # PT/EN: "Responsável: Nome"
+    r"apply\s+to\s+",                       # LinkedIn "Apply to Nome Sobrenome"
 ]
 
-_NAME_RE = re.compile("|".join(_NAME_PATTERNS), re.IGNORECASE)
+# Uma única regex, varrida uma vez por descrição. Os rótulos são fatorados
+# numa só alternância seguida de um único grupo de nome (em vez de oito
+# alternativas que repetiam o padrão do nome); "Contact Nome at" é o único
+# caso com sufixo e fica à parte
+_RECRUITER_RE = re.compile(
+    rf"(?:{'|'.join(_NAME_PREFIXES)})(?P<name>{_PERSON})"
+    rf"|contact\s+(?P<name_at>{_PERSON})\s+at\b"            # EN: "Contact Nome at"
+    rf"|(?P<email>{_EMAIL_RE.pattern})",
+    re.IGNORECASE,
+)
 
+# E-mails de imagem/logo que aparecem em HTML convertido
+_IMAGE_SUFFIXES = (".png", ".jpg", ".gif", ".svg")
 
-def _extract_email_from_text(text: str) -> str | None:
-    """Extrai o primeiro e-mail encontrado em um texto livre."""
-    if not text:
-        return None
-    found = _EMAIL_RE.findall(text)
-    # Remove e-mails genéricos de imagem/logo que aparecem em HTML convertido
-    filtered = [e for e in found if not e.endswith((".png", ".jpg", ".gif", ".svg"))]
-    return filtered[0] if filtered else None
+_NULL_TEXT = ("", "nan", "None")
 
 
-def _extract_name_from_text(text: str) -> str | None:
-    """Tenta extrair o nome do recrutador de padrões comuns na descrição."""
-    if not text:
-        return None
-    m = _NAME_RE.search(text)
-    if not m:
-        return None
-    # Retorna o primeiro grupo de captura que não seja None
-    for group in m.groups():
-        if group:
-            return group.strip()
-    return None
+def _first_per_row(values: pd.Series, index: pd.Index) -> pd.Series:
+    """Primeiro valor não nulo de cada linha original (nível 0 do extractall)."""
+    return values.dropna().groupby(level=0).first().reindex(index)
 
 
 def enrich_recruiter_info(df: pd.DataFrame) -> pd.DataFrame:
@@ -70,25 +62,33 @@ def enrich_recruiter_info(df: pd.DataFrame) -> pd.DataFrame:
       caso contrário, tenta extrair da descrição via regex.
     - nome_recrutador: extrai da descrição via padrões de texto comuns.
       Retorna None quando não encontrar.
-    """
-    df = df.copy()
 
-    def _get_email(row: pd.Series) -> str | None:
-        # JobSpy já extrai alguns e-mails na coluna 'emails'
-        raw = row.get("emails")
-        if raw and str(raw) not in ("", "nan", "None"):
-            return str(raw).strip()
-        # Fallback: regex na descrição
-        return _extract_email_from_text(str(row.get("descricao") or ""))
-
-    def _get_name(row: pd.Series) -> str | None:
-        return _extract_name_from_text(str(row.get("descricao") or ""))
+    Altera df no lugar (sem cópia do frame inteiro) e o devolve.
+    """
+    if "descricao" in df.columns:
+        desc = df["descricao"].fillna("").astype(str)
+    else:
+        desc = pd.Series("", index=df.index, dtype=object)
+
+    # Uma varredura por descrição, na coluna inteira (str.extractall) em
+    # vez de um apply por linha
+    matches = desc.str.extractall(_RECRUITER_RE)
+    found = matches["email"].dropna()
+    email = _first_per_row(found[~found.str.endswith(_IMAGE_SUFFIXES)], desc.index)
+    names = matches["name"].fillna(matches["name_at"])
+    name = _first_per_row(names, desc.index)
+
+    # JobSpy já extrai alguns e-mails na coluna 'emails'; têm prioridade
+    if "emails" in df.columns:
+        raw = df["emails"].astype(str)
+        valid = df["emails"].notna() & ~raw.isin(_NULL_TEXT)
+        email = raw.str.strip().where(valid, email)
 
-    df["email_recrutador"] = df.apply(_get_email, axis=1)
-    df["nome_recrutador"] = df.apply(_get_name, axis=1)
+    df["email_recrutador"] = email
+    df["nome_recrutador"] = name
 
     # Remove a coluna bruta 'emails' após usar
     if "emails" in df.columns:
-        df = df.drop(columns=["emails"])
+        df.drop(columns=["emails"], inplace=True)
 
     return df
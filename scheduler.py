@@ -9,14 +9,14 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-import yaml
-
-from filters import apply_all_filters
-from scraper import search_jobs
+# yaml, pandas, filters e scraper (que puxa o JobSpy) são importados dentro
+# das funções: importar este módulo não custa a árvore de dependências inteira
 
 
 def load_config(config_path: str = "config.yaml") -> dict[str, Any]:
     """Carrega o arquivo de configuração YAML."""
+    import yaml
+
     path = Path(config_path)
     if not path.exists():
         raise FileNotFoundError(f"Arquivo de configuração não encontrado: {config_path}")
@@ -29,6 +29,9 @@ def run_all_searches(config: dict[str, Any]) -> None:
     """Executa todas as buscas definidas na config e salva os resultados."""
     import pandas as pd
 
+    from filters import apply_all_filters
+    from scraper import search_jobs
+
     searches = config.get("searches", [])
     output_cfg = config.get("output", {})
     out_dir = Path(output_cfg.get("directory", "output"))
@@ -38,7 +41,19 @@ def run_all_searches(config: dict[str, Any]) -> None:
 
     timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M")
 
-    all_results: list = []
+    filename = f"{prefix}_{timestamp}"
+    # CSV é gravado busca a busca (memória limitada a uma busca e progresso
+    # parcial preservado); o Excel não tem append e continua acumulando
+    stream_csv = fmt != "excel"
+    out_path = out_dir / (f"{filename}.csv" if stream_csv else f"{filename}.xlsx")
+    columns: list[str] | None = None
+    excel_frames: list = []
+    batches = 0
+    total_rows = 0
+    # Links já aceitos em buscas anteriores: descartados antes de filtrar.
+    # Só entram aqui links que passaram nos filtros, para que uma vaga
+    # recusada por uma busca ainda possa ser aceita por outra
+    seen: set[str] = set()
 
     for i, search in enumerate(searches, 1):
         print(f"\n[{i}/{len(searches)}] Busca: '{search['search_term']}'")
@@ -50,38 +65,47 @@ def run_all_searches(config: dict[str, Any]) -> None:
             results_wanted=search.get("results_wanted", 25),
             hours_old=search.get("hours_old", 168),
             verbose=True,
+            # Descrição completa do LinkedIn só quando o filtro de skills a
+            # usa ou a busca pede explicitamente (fetch_description: true)
+            fetch_description=bool(search.get("fetch_description") or search.get("skills")),
         )
 
         if df.empty:
             print("  Nenhuma vaga encontrada nesta busca.")
             continue
 
+        if seen:
+            df = df[~df["link"].isin(seen)]
+
         df = apply_all_filters(
             df,
             skills=search.get("skills"),
             remote_only=search.get("remote_only", False),
         )
+        seen.update(df["link"])
 
         print(f"  Vagas após filtros: {len(df)}")
-        all_results.append(df)
-
-    if not all_results:
+        if stream_csv:
+            if columns is None:
+                columns = list(df.columns)
+                df.to_csv(out_path, index=False, encoding="utf-8-sig")
+            else:
+                df.reindex(columns=columns).to_csv(
+                    out_path, mode="a", header=False, index=False, encoding="utf-8-sig")
+        else:
+            excel_frames.append(df)
+        batches += 1
+        total_rows += len(df)
+
+    if not batches:
         print("\nNenhuma vaga encontrada em todas as buscas.")
         return
 
-    combined = pd.concat(all_results, ignore_index=True)
-    combined = combined.drop_duplicates(subset=["link"], keep="first")
-
-    filename = f"{prefix}_{timestamp}"
-
-    if fmt == "excel":
-        out_path = out_dir / f"{filename}.xlsx"
-        combined.to_excel(out_path, index=False)
-    else:
-        out_path = out_dir / f"{filename}.csv"
-        combined.to_csv(out_path, index=False, encoding="utf-8-sig")
+    if not stream_csv:
+        combined = pd.concat(excel_frames, ignore_index=True)
+        combined.to_excel(out_path, index=False, engine="xlsxwriter")
 
-    print(f"\nTotal de vagas salvas: {len(combined)}")
+    print(f"\nTotal de vagas salvas: {total_rows}")
     print(f"Arquivo: {out_path.resolve()}")
 
 
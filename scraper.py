@@ -4,11 +4,13 @@ scraper.py - Lógica de scraping de vagas via python-jobspy
 
 from __future__ import annotations
 
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional
 
 import pandas as pd
 
+from database import cache_get, cache_key, cache_put
+
 VALID_SITES = {"linkedin", "indeed", "glassdoor", "zip_recruiter"}
 
 COLUMNS_RENAME = {
@@ -53,6 +55,8 @@ def search_jobs(
     hours_old: int = 168,
     country: str = "Brazil",
     verbose: bool = True,
+    cache_ttl: int = 900,
+    fetch_description: bool = True,
 ) -> pd.DataFrame:
     """
     Busca vagas de emprego em múltiplos sites via JobSpy.
@@ -65,6 +69,11 @@ def search_jobs(
         hours_old: Filtrar vagas postadas nas últimas N horas.
         country: País para Indeed (ex: "Brazil", "USA").
         verbose: Imprimir progresso no terminal.
+        cache_ttl: Segundos em que a mesma busca por site é servida do cache
+            (0 = sempre consultar).
+        fetch_description: Buscar a descrição completa das vagas do LinkedIn
+            (uma requisição extra por vaga). Desligue quando ninguém for ler
+            a coluna 'descricao'.
 
     Returns:
         DataFrame com as vagas encontradas.
@@ -90,30 +99,38 @@ def search_jobs(
         print(f"Sites: {', '.join(sites)} | Resultados por site: {results_wanted}")
         print(f"Vagas postadas nas últimas {hours_old}h\n")
 
-    all_frames: list[pd.DataFrame] = []
-
-    for site in sites:
-        if verbose:
-            print(f"  -> Scraping {site}...", end=" ", flush=True)
-        try:
-            df = scrape_jobs(
+    # Um site por thread: as chamadas são só espera de rede, e hosts
+    # diferentes não disputam o mesmo rate limit
+    results: dict[str, pd.DataFrame] = {}
+    with ThreadPoolExecutor(max_workers=len(sites) or 1) as ex:
+        futures = {
+            ex.submit(
+                _scrape_site, scrape_jobs, cache_ttl,
                 site_name=[site],
                 search_term=search_term,
                 location=location,
                 results_wanted=results_wanted,
                 hours_old=hours_old,
                 country_indeed=country,
-                linkedin_fetch_description=True,
-            )
-            count = len(df) if df is not None else 0
+                linkedin_fetch_description=fetch_description,
+            ): site
+            for site in sites
+        }
+        for fut in as_completed(futures):
+            site = futures[fut]
+            try:
+                df = fut.result()
+            except Exception as exc:
+                if verbose:
+                    print(f"  -> {site}: ERRO ({exc})")
+                continue
             if verbose:
-                print(f"{count} vagas encontradas")
+                print(f"  -> {site}: {len(df) if df is not None else 0} vagas encontradas")
             if df is not None and not df.empty:
-                all_frames.append(df)
-        except Exception as exc:
-            if verbose:
-                print(f"ERRO ({exc})")
-        time.sleep(1)
+                results[site] = df
+
+    # Mantém a ordem dos sites pedidos, independente da ordem de conclusão
+    all_frames = [results[site] for site in sites if site in results]
 
     if not all_frames:
         if verbose:
@@ -129,6 +146,20 @@ def search_jobs(
     return combined
 
 
+def _scrape_site(scrape_jobs, cache_ttl: int, **kwargs) -> pd.DataFrame | None:
+    """Chama o JobSpy para um site, reaproveitando o resultado em cache se recente."""
+    key = cache_key("jobspy", sorted(kwargs.items()))
+    if cache_ttl:
+        cached = cache_get(key, cache_ttl)
+        if cached is not None:
+            return cached
+    df = scrape_jobs(**kwargs)
+    # Frame vazio costuma ser bloqueio/limite do site: não fica em cache
+    if cache_ttl and df is not None and not df.empty:
+        cache_put(key, df, cache_ttl)
+    return df
+
+
 def _normalize_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     """Renomeia colunas e mantém apenas as relevantes."""
     df = df.rename(columns=COLUMNS_RENAME)
@@ -137,11 +168,24 @@ def _normalize_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     df = df[keep].copy()
 
     if "data_postagem" in df.columns:
-        df["data_postagem"] = pd.to_datetime(
-            df["data_postagem"], errors="coerce"
-        ).dt.strftime("%Y-%m-%d")
+        raw = df["data_postagem"]
+        # Formato fixo (caminho rápido, sem inferência por elemento); o
+        # parser flexível só roda no que não estava em YYYY-MM-DD. Cada parte
+        # é formatada separadamente: a flexível pode vir com fuso horário
+        parsed = pd.to_datetime(raw, format="%Y-%m-%d", errors="coerce")
+        out = parsed.dt.strftime("%Y-%m-%d")
+        retry = parsed.isna() & raw.notna()
+        if retry.any():
+            out[retry] = pd.to_datetime(raw[retry], errors="coerce").dt.strftime("%Y-%m-%d")
+        df["data_postagem"] = out
 
     if "remoto" in df.columns:
         df["remoto"] = df["remoto"].fillna(False).astype(bool)
 
+    # Poucos valores distintos por coluna: category guarda códigos inteiros
+    # em vez de um objeto str por linha
+    for col in ("site", "tipo_vaga", "moeda"):
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+
     return df